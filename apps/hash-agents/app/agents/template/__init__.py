@@ -1,5 +1,7 @@
 """A template agent, which provides a simple interface into LangChain's LLMMathChain."""
 
+from functools import cache
+
 from beartype import beartype
 from langchain import LLMMathChain
 from langchain.chat_models import ChatOpenAI
@@ -7,6 +9,28 @@ from langchain.chat_models import ChatOpenAI
 from .io_types import Input, Output
 
 
+@cache
+@beartype
+def get_llm() -> ChatOpenAI:
+    """Returns the chat model shared between calls of the agent.
+
+    The agent package stays imported between runs, so creating the client once
+    lets successive calls reuse its configuration and connections.
+    """
+    return ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0)
+
+
+@cache
+@beartype
+def get_llm_math() -> LLMMathChain:
+    """Returns the LLMMathChain shared between calls of the agent.
+
+    Building the chain sets up its prompt template and inner LLM chain, which
+    only needs to happen once.
+    """
+    return LLMMathChain(llm=get_llm(), verbose=True)
+
+
 @beartype
 def execute(agent_input: Input) -> Output:
     """Calls LLMMathChain with the given input.
@@ -14,8 +38,6 @@ def execute(agent_input: Input) -> Output:
     :param agent_input: Input defined in `io_types.ts`
     :return: Output defined in `io_types.ts`.
     """
-    llm = ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0)
-    llm_math = LLMMathChain(llm=llm, verbose=True)
-    result = llm_math.run(agent_input.expression)
+    result = get_llm_math().run(agent_input.expression)
     # ltrim "Answer: " from result
     return Output(result=float(result[8:]))
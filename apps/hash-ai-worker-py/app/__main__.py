@@ -7,12 +7,14 @@ from dotenv import find_dotenv, load_dotenv
 from temporalio.client import Client
 from temporalio.worker import Worker
 
-from app.activities import complete
-from app.workflows import DemoWorkflowPy
-
+# The environment has to be loaded before the activities are imported, as
+# they read their configuration at import time.
 load_dotenv()
 load_dotenv(dotenv_path=find_dotenv(filename=".env.local"))
 
+from app.activities import complete, complete_batch  # noqa: E402
+from app.workflows import DemoBatchWorkflowPy, DemoWorkflowPy  # noqa: E402
+
 
 async def run_worker(stop_event: asyncio.Event) -> None:
     """Connects Temporal cluster and starts worker."""
@@ -22,17 +24,31 @@ async def run_worker(stop_event: asyncio.Event) -> None:
 
     client = await Client.connect(temporal_target, namespace="default")
 
+    # Throttle the activities calling the OpenAI API, so they stay within the
+    # rate limit of the API key. The concurrency limit applies to this worker,
+    # while the rate limit is shared by all workers on the task queue.
+    max_concurrent_requests = os.environ.get("OPENAI_MAX_CONCURRENT_REQUESTS")
+    max_requests_per_minute = os.environ.get("OPENAI_MAX_RPM")
+
     worker = Worker(
         client,
         task_queue="aipy",
         # Register workflows
         workflows=[
             DemoWorkflowPy,
+            DemoBatchWorkflowPy,
         ],
         # Register activities
         activities=[
             complete,
+            complete_batch,
         ],
+        max_concurrent_activities=(
+            int(max_concurrent_requests) if max_concurrent_requests else 100
+        ),
+        max_task_queue_activities_per_second=(
+            int(max_requests_per_minute) / 60 if max_requests_per_minute else None
+        ),
     )
 
     async with worker:
@@ -4,21 +4,41 @@ import os
 import openai
 from temporalio import activity
 
+# The API key is read once when the module is imported, so the environment
+# (including any `.env` files) has to be loaded before importing this module.
+openai.api_key = os.environ.get("OPENAI_API_KEY")
+
 
 @activity.defn
-async def complete(prompt: str) -> str:
-    """Completes a prompt using the OpenAI API."""
-    openai.api_key = os.environ.get("OPENAI_API_KEY")
+async def complete_batch(prompts: list[str]) -> list[str]:
+    """Completes a batch of prompts using a single OpenAI API request."""
+    # The OpenAI API rejects requests without a prompt.
+    if not prompts:
+        return []
+
     completion = await openai.Completion.acreate(
         model="ada",
-        prompt=prompt,
+        prompt=prompts,
         temperature=0,
         max_tokens=10,
     )
 
+    # The choices are not guaranteed to be returned in the order of the
+    # prompts, so they have to be mapped back using their index.
+    choices = sorted(completion["choices"], key=lambda choice: choice["index"])
+
     # We suspect that due to the Temporal decorator, we must explicitly bind
     # the return value before returning it.
     # If we don't do this, the activity will mysteriously fail.
-    text_response = completion["choices"][0]["text"]
+    text_responses = [choice["text"] for choice in choices]
+
+    return text_responses  # noqa: RET504
+
+
+@activity.defn
+async def complete(prompt: str) -> str:
+    """Completes a prompt using the OpenAI API."""
+    # See `complete_batch` for why the return value is bound explicitly.
+    text_response = (await complete_batch([prompt]))[0]
 
     return text_response  # noqa: RET504
@@ -4,7 +4,7 @@ from datetime import timedelta
 from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
-    from .activities import complete
+    from .activities import complete, complete_batch
 
 
 @workflow.defn
@@ -19,3 +19,21 @@ class DemoWorkflowPy:
             prompt,
             start_to_close_timeout=timedelta(seconds=2),
         )
+
+
+@workflow.defn
+class DemoBatchWorkflowPy:
+    """A workflow that uses the OpenAI API to complete a list of prompts."""
+
+    @workflow.run
+    async def run(self, prompts: list[str]) -> list[str]:
+        """Execute the `complete_batch` activity with the given `prompts`."""
+        # An empty batch would result in a zero timeout, which Temporal rejects.
+        if not prompts:
+            return []
+
+        return await workflow.execute_activity(
+            complete_batch,
+            prompts,
+            start_to_close_timeout=timedelta(seconds=2 * len(prompts)),
+        )